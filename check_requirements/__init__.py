@@ -2,6 +2,9 @@
 check_requirements: A utility package for managing and checking Python package dependencies.
 
 This package provides tools for listing, comparing, and checking package dependencies in a Python environment.
+
+check_requirements is a short-lived command-line tool, so it stays pure Python: a JIT compiler such as numba would
+spend longer compiling on every run than the dependency checks take. The CI workflow rejects numba imports.
 """
 
 
@@ -16,6 +19,7 @@ __version__ = "0.1.0"
 
 
 from .core import get_list, parse_deps_tree, add_info, filter_deps_tree, ignore_pkgs, print_deps_tree, \
-    write_deps_tree_to_file, is_pkg_in_subtree, find_missing_pkgs, check_and_raise_error, format_full_version
+    write_deps_tree_to_file, index_deps_tree, is_pkg_in_subtree, find_missing_pkgs, check_and_raise_error, \
+    format_full_version
 from .git_push import push_reqs_file
 from .github_pull import gh_pull_req_for_reqs_file
@@ -39,6 +39,7 @@ import os
 import sys
 import platform
 import argparse
+from functools import lru_cache
 from .core import get_list, parse_deps_tree, add_info, ignore_pkgs, update_reqs, format_full_version
 from .git_push import push_reqs_file
 from .github_pull import gh_pull_req_for_reqs_file
@@ -46,12 +47,16 @@ from .cli import list_deps, output, check_missing, check_extra, raise_missing_er
     process_deps_file
 
 
-def main():
+@lru_cache(maxsize=None)
+def get_parser():
     """
-    Main function for the check_requirements.
-    Parses command-line arguments and executes the specified actions based on the arguments.
+    Builds the command-line argument parser for the check_requirements.
+    The parser is built once and shared by later calls, so callers must not add arguments to it.
+
+    Returns:
+        argparse.ArgumentParser: The parser holding every option of the check_requirements.
     """
-    parser = argparse.ArgumentParser(description="check_requirements")
+    parser = argparse.ArgumentParser(prog="check_requirements", description="check_requirements")
     parser.add_argument("--list", "-l", action="store_true", help="List dependencies to console")
     parser.add_argument("--output", "-o", type=str, help="Save dependencies to a file")
     parser.add_argument("--file", "-f", type=str, help="Existing requirements file")
@@ -70,7 +75,18 @@ def main():
     parser.add_argument("--ignore", "-i", type=str, help="File containing ignored packages")
     parser.add_argument("--ignore-packages", "-ip", nargs="+", help="List of packages to ignore")
     parser.add_argument("--with-info", "-wi", nargs="+", help="Include requested system information")
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """
+    Main function for the check_requirements.
+    Parses command-line arguments and executes the specified actions based on the arguments.
+
+    Args:
+        argv (list, optional): Arguments to parse instead of sys.argv[1:]. Defaults to None.
+    """
+    args = get_parser().parse_args(argv)
     sys_info = {
         "os_name": os.name,
         "sys_platform": sys.platform,
@@ -87,6 +103,8 @@ def main():
     deps = parse_deps_tree(get_list())
     file_deps = None
     ignored_pkgs = None
+    extra = args.check_extra or args.raise_extra_error
+    installed = not extra or args.check_missing or args.raise_missing_error or args.list or args.output
     if args.with_info and (args.list or args.output):
         sys_info_req = {key: sys_info[key] for key in args.with_info}
         deps = add_info(deps, **sys_info_req)
@@ -94,15 +112,13 @@ def main():
         with open(args.ignore, 'r', encoding="utf-8") as file:
             ignore_lines = file.read()
             ignored_pkgs = parse_deps_tree(ignore_lines)
-            if not args.check_extra:
-                deps = ignore_pkgs(deps, ignored_pkgs)
     elif args.ignore_packages:
         ignored_pkgs = parse_deps_tree(f"{chr(10).join(args.ignore_packages)}\n")
-        if not args.check_extra:
-            deps = ignore_pkgs(deps, ignored_pkgs)
+    if ignored_pkgs is not None and installed:
+        deps = ignore_pkgs(deps, ignored_pkgs)
     if args.file:
         file_deps = process_deps_file(args.file, sys_info)
-        if args.check_extra and ignored_pkgs:
+        if extra and ignored_pkgs:
             file_deps = ignore_pkgs(file_deps, ignored_pkgs)
     if args.list:
         list_deps(deps)
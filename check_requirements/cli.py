@@ -122,9 +122,7 @@ def raise_missing_error(deps, file_deps):
     Returns:
         None
     """
-    missing_pkgs = find_missing_pkgs(deps, file_deps)
-    if missing_pkgs:
-        check_and_raise_error(deps, file_deps)
+    check_and_raise_error(deps, file_deps)
 
 
 def raise_extra_error(deps, file_deps):
@@ -138,9 +136,7 @@ def raise_extra_error(deps, file_deps):
     Returns:
         None
     """
-    extra_pkgs = find_missing_pkgs(file_deps, deps)
-    if extra_pkgs:
-        check_and_raise_error(file_deps, deps)
+    check_and_raise_error(file_deps, deps)
 
 
 def process_deps_file(dep_file, sys_info):
@@ -11,6 +11,7 @@ Functions:
  - ignore_pkgs(deps: list, ignored_pkgs: list): Ignores specified packages from the dependency tree.
  - print_deps_tree(deps: list, indent: int = 0): Prints the dependency tree to the console.
  - write_deps_tree_to_file(file_path: str, deps: dict, indent: int = 0): Writes the dependency tree to a file.
+ - index_deps_tree(deps: list): Indexes the versions of every package in a dependency tree by package name.
  - is_pkg_in_subtree(pkg: dict, deps: list): Checks if a package exists in a dependency subtree.
  - find_missing_pkgs(deps_a: list, deps_b: list): Finds missing packages in deps_a compared to
  deps_b.
@@ -85,7 +86,7 @@ def parse_deps_tree(lines):
             sys_info = info[1].split(" and ")
             sys_info = [var.strip().split("==") for var in sys_info]
             for var in sys_info:
-                pkg_data[var[0].strip()] = var[1].strip()
+                pkg_data[sys.intern(var[0].strip())] = sys.intern(var[1].strip())
         pkg_data["deps"] = []
         if parent is not None:
             parent["deps"].append(pkg_data)
@@ -133,7 +134,16 @@ def filter_deps_tree(deps, **kwargs):
     Returns:
     list: A filtered list of packages that match the specified criteria.
     """
-    return [pkg for pkg in deps if all(pkg.get(key) == val for key, val in kwargs.items() if pkg.get(key))]
+    criteria = tuple(kwargs.items())
+
+    def matches(pkg):
+        for key, val in criteria:
+            pkg_val = pkg.get(key)
+            if pkg_val and pkg_val != val:
+                return False
+        return True
+
+    return [pkg for pkg in deps if matches(pkg)]
 
 
 def ignore_pkgs(deps, ignored_pkgs):
@@ -148,27 +158,71 @@ def ignore_pkgs(deps, ignored_pkgs):
     Returns:
         list: The updated dependency tree with ignored packages removed.
     """
+    ignored_index = {}
+    for ignored in ignored_pkgs:
+        ignored_index.setdefault(ignored["name"], []).append(ignored)
+    return _ignore_indexed_pkgs(deps, ignored_index)
+
+
+def _is_pkg_ignored(pkg, ignored_index):
+    """
+    Checks if a package matches any ignored package with the same name.
+
+    Args:
+    pkg (dict): A dictionary representing the package.
+    ignored_index (dict): Ignored packages grouped by name, as built by ignore_pkgs.
+
+    Returns:
+    bool: True if the package is ignored, False otherwise.
+    """
+    return any(
+        (pkg.get("at") == ignored.get("at") if ignored.get("at") else True)
+        and (pkg.get("version") == ignored.get("version") if ignored.get("version") else True)
+        for ignored in ignored_index.get(pkg["name"], ())
+    )
+
+
+def _ignore_indexed_pkgs(deps, ignored_index):
+    """
+    Removes ignored packages from the dependency tree using a name-keyed index.
+
+    Args:
+    deps (list): A list of hierarchical dictionaries representing the dependency tree.
+    ignored_index (dict): Ignored packages grouped by name, as built by ignore_pkgs.
+
+    Returns:
+    list: The updated dependency tree with ignored packages removed.
+    """
     updated_deps = []
     for pkg in deps:
-        if any(
-                pkg["name"] == ignored["name"]
-                and (
-                        (pkg.get("at") == ignored.get("at")) if ignored.get("at") else True
-                )
-                and (
-                        (pkg.get("version") == ignored.get("version")) if ignored.get("version") else True
-                )
-                for ignored in ignored_pkgs
-        ):
-            updated_deps.extend(ignore_pkgs(pkg["deps"], ignored_pkgs))
+        if _is_pkg_ignored(pkg, ignored_index):
+            updated_deps.extend(_ignore_indexed_pkgs(pkg["deps"], ignored_index))
         else:
             pkg_copy = pkg.copy()
             if pkg_copy["deps"]:
-                pkg_copy["deps"] = ignore_pkgs(pkg_copy["deps"], ignored_pkgs)
+                pkg_copy["deps"] = _ignore_indexed_pkgs(pkg_copy["deps"], ignored_index)
             updated_deps.append(pkg_copy)
     return updated_deps
 
 
+def _format_marker(key, val, first, last):
+    """
+    Formats an environment marker of a package line.
+
+    Args:
+    key (str): The name of the marker.
+    val (str): The value of the marker.
+    first (bool): Whether it is the first marker of the line, which is preceded by a semicolon.
+    last (bool): Whether it is the last marker of the line, which is not followed by "and".
+
+    Returns:
+    str: The formatted marker, or an empty string if the marker has no value.
+    """
+    if not val:
+        return ""
+    return f"{'; ' if first else ''}{key} == {val}{'' if last else ' and '}"
+
+
 def print_deps_tree(deps, indent=0):
     """
     Prints the dependency tree to the console.
@@ -178,23 +232,28 @@ def print_deps_tree(deps, indent=0):
     indent (int, optional): Indentation level for formatting. Defaults to 0.
     """
     for pkg in deps:
-        print("  " * indent, end="")
+        line = ["  " * indent]
         semicolon = True
+        last = len(pkg) - 1
         for count, (key, val) in enumerate(pkg.items(), start=1):
             if key == "name":
-                print(val, end="")
-            if key == "at" and val:
-                print(f" @ {val}", end="")
-            if key == "version" and val:
-                print(f" == {val}", end="")
-            if key not in ["name", "at", "version", "deps"] and val:
-                if semicolon:
-                    print(";", end=" ")
-                    semicolon = False
-                print(f"{key} == {val}", end=" and " if count != len(pkg.items()) - 1 else "")
-            if key == "deps":
-                print("")
+                line.append(f"{val}")
+            elif key == "at":
+                if val:
+                    line.append(f" @ {val}")
+            elif key == "version":
+                if val:
+                    line.append(f" == {val}")
+            elif key == "deps":
+                print("".join(line))
+                line = []
                 print_deps_tree(pkg["deps"], indent + 1)
+            else:
+                marker = _format_marker(key, val, semicolon, count == last)
+                semicolon = semicolon and not marker
+                line.append(marker)
+        if line:
+            print("".join(line), end="")
 
 
 def write_deps_tree_to_file(file_path, deps, mode="w"):
@@ -212,28 +271,73 @@ def write_deps_tree_to_file(file_path, deps, mode="w"):
     sys.stdout = original_stdout
 
 
+def index_deps_tree(deps):
+    """
+    Indexes the versions of every package in a dependency tree by package name.
+
+    Args:
+    deps (list): A hierarchical dictionary representing the dependency tree.
+
+    Returns:
+    dict: A dictionary mapping package names to the set of their versions, with None for packages without a version.
+    """
+    index = {}
+    stack = list(deps)
+    while stack:
+        dep_pkg = stack.pop()
+        index.setdefault(dep_pkg["name"], set()).add(dep_pkg.get("version") or None)
+        stack.extend(dep_pkg["deps"])
+    return index
+
+
+def _is_pkg_in_index(pkg, index):
+    """
+    Checks if a package exists in a dependency tree index.
+
+    Args:
+    pkg (dict): A dictionary representing the package to check.
+    index (dict): A dependency tree index built by index_deps_tree.
+
+    Returns:
+    bool: True if the package exists in the index, False otherwise.
+    """
+    versions = index.get(pkg["name"])
+    if versions is None:
+        return False
+    return not pkg.get("version") or None in versions or pkg["version"] in versions
+
+
 def is_pkg_in_subtree(pkg, deps):
     """
     Checks if a package exists in a dependency subtree.
 
     Args:
     pkg (dict): A dictionary representing the package to check.
-    deps (list): A hierarchical dictionary representing the dependency tree.
+    deps (list or dict): A hierarchical dictionary representing the dependency tree, or its index built by
+        index_deps_tree to check many packages against the same tree.
 
     Returns:
     bool: True if the package exists in the subtree, False otherwise.
     """
-    for dep_pkg in deps:
-        if (
-                pkg["name"] == dep_pkg["name"]
-                and (
-                (pkg.get("version") == dep_pkg.get("version"))
-                if pkg.get("version") and dep_pkg.get("version") else True)
-        ):
-            return True
-        if is_pkg_in_subtree(pkg, dep_pkg["deps"]):
-            return True
-    return False
+    index = deps if isinstance(deps, dict) else index_deps_tree(deps)
+    return _is_pkg_in_index(pkg, index)
+
+
+def _iter_missing_pkgs(deps_a, index):
+    """
+    Yields packages in deps_a that are missing from a dependency tree index.
+
+    Args:
+    deps_a (list): A hierarchical dictionary representing the dependency tree to check.
+    index (dict): A dependency tree index built by index_deps_tree.
+
+    Yields:
+    dict: Missing packages in depth-first order, possibly with duplicates.
+    """
+    for pkg_a in deps_a:
+        if not _is_pkg_in_index(pkg_a, index):
+            yield pkg_a
+        yield from _iter_missing_pkgs(pkg_a["deps"], index)
 
 
 def find_missing_pkgs(deps_a, deps_b):
@@ -248,12 +352,7 @@ def find_missing_pkgs(deps_a, deps_b):
     list: A list of missing packages.
     """
 
-    missing_pkgs = []
-    for pkg_a in deps_a:
-        if not is_pkg_in_subtree(pkg_a, deps_b):
-            missing_pkgs.append(pkg_a)
-        missing_pkgs.extend(find_missing_pkgs(pkg_a["deps"], deps_b))
-    return list({name["name"]: name for name in missing_pkgs}.values())
+    return list({pkg["name"]: pkg for pkg in _iter_missing_pkgs(deps_a, index_deps_tree(deps_b))}.values())
 
 
 def check_and_raise_error(deps_a, deps_b):
@@ -268,10 +367,10 @@ def check_and_raise_error(deps_a, deps_b):
     ImportError: If missing packages are found.
     """
 
-    missing_pkgs = find_missing_pkgs(deps_a, deps_b)
+    missing_pkgs = {pkg["name"]: pkg for pkg in _iter_missing_pkgs(deps_a, index_deps_tree(deps_b))}
     if missing_pkgs:
         err_msg = "Missing packages:\n"
-        for pkg in missing_pkgs:
+        for pkg in missing_pkgs.values():
             err_msg += f"{pkg['name']}{f''' == {pkg.get('version')}''' if pkg.get('version') else ''}\n"
         raise ImportError(err_msg)
 
@@ -5,6 +5,12 @@ The tests cover various aspects of dependency management, including listing depe
 extra packages, ignoring packages, and raising errors for missing or extra dependencies. The test functions are
 defined in the `tests.py` module, the tester functions are defined in the `testers.py` module, and the testing
 helpers are defined in the `tests/helpers.py` module.
+
+The tests run with NUMBA_DISABLE_JIT set, before anything imports `check_requirements`, so that a numba helper added
+later cannot make the short test runs wait for JIT compilation. Tests for real JIT code paths would have to unset it.
 """
 
+import os
 import pytest
+
+os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
@@ -1,25 +1,34 @@
 """
 This script is used to run the unit tests for the `check_requirements` package.
 
-It imports all the defined unit test functions from the `tests` module and executes them. The script is intended
-to be run as the main entry point for running the unit tests.
+It imports all the defined unit test functions from the `tests` module so that pytest collects them from here, and
+runs pytest on them when executed. The script is intended to be run as the main entry point for running the unit
+tests.
 
 Usage:
-    python -m check_requirements.tests.__main__
+    python -m tests
 
 Note:
     The unit test functions are responsible for checking various aspects of the `check_requirements` package,
     including listing dependencies, parsing dependency tree structures, checking for missing or extra packages,
     ignoring packages, and raising errors for missing or extra dependencies.
+
+    The tests that need dummy packages installed are listed next to the tests that need the same packages, so that
+    consecutive tests reuse one installation instead of reinstalling it.
 """
 
+import os
+import sys
+import pytest
 from .tests import (test_get_list,
                     test_parse_deps_tree,
                     test_add_info,
-                    test_print_deps_tree,
-                    test_write_deps_tree_to_file,
+                    test_filter_deps_tree,
+                    test_emit_deps_tree,
                     test_is_pkg_in_subtree,
+                    test_is_pkg_in_subtree__indexed,
                     test_find_missing_pkgs,
+                    test_find_missing_pkgs__version_mismatch,
                     test_find_missing_pkgs__ignored,
                     test_check_and_raise_error,
                     test_check_and_raise_error__ignored,
@@ -30,46 +39,12 @@ from .tests import (test_get_list,
                     test_main__output_with_info,
                     test_main__check_missing,
                     test_main__check_missing_ignore,
+                    test_main__check_missing_ignore_packages_with_raise_extra,
                     test_main__check_missing_ignore_packages,
-                    test_main__check_missing_ignore__2,
-                    test_main__check_missing_ignore_packages__2,
                     test_main__check_extra,
                     test_main__check_extra_ignore,
-                    test_main__check_extra_ignore_packages,
-                    test_main__raise_missing_error,
-                    test_main__raise_missing_error_ignore,
-                    test_main__raise_missing_error_ignore_packages,
-                    test_main__raise_extra_error,
-                    test_main__raise_extra_error_ignore,
-                    test_main__raise_extra_error_ignore_packages
+                    test_main__check_extra_ignore_packages
                     )
+
 if __name__ == "__main__":
-    test_get_list()
-    test_parse_deps_tree()
-    test_add_info()
-    test_print_deps_tree()
-    test_write_deps_tree_to_file()
-    test_is_pkg_in_subtree()
-    test_find_missing_pkgs()
-    test_find_missing_pkgs__ignored()
-    test_check_and_raise_error()
-    test_check_and_raise_error__ignored()
-    test_main__help()
-    test_main__list()
-    test_main__list_with_info()
-    test_main__output()
-    test_main__output_with_info()
-    test_main__check_missing()
-    test_main__check_missing_ignore()
-    test_main__check_missing_ignore_packages()
-    test_main__check_missing_ignore__2()
-    test_main__check_missing_ignore_packages__2()
-    test_main__check_extra()
-    test_main__check_extra_ignore()
-    test_main__check_extra_ignore_packages()
-    test_main__raise_missing_error()
-    test_main__raise_missing_error_ignore()
-    test_main__raise_missing_error_ignore_packages()
-    test_main__raise_extra_error()
-    test_main__raise_extra_error_ignore()
-    test_main__raise_extra_error_ignore_packages()
+    sys.exit(pytest.main([os.path.dirname(os.path.abspath(__file__))]))
@@ -0,0 +1,211 @@
+"""
+This module contains the pytest configuration shared by the unit tests of the check_requirements package.
+
+Tests that need dummy packages installed request one of the installed_* fixtures. The packages are installed once and
+kept installed until a test asks for a different set, so consecutive tests sharing a set share a single pip run. These
+tests change the environment shared by every pytest-xdist worker, so they are sent to a single worker, and they wait for
+pip, so they are marked as slow. The tests that run the command-line client or pipdeptree are marked as integration.
+
+The requirements files read by the tests are created once per session by the dummy_pkg_files and pkg_files fixtures.
+"""
+
+import sys
+from importlib.util import find_spec
+from subprocess import run, DEVNULL
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+import pytest
+from dummy_package_manager import DummyPackage
+from .helpers import _dummy_pkg_file, _pkg_file
+
+
+class _installed_pkgs:
+    """
+    Keeps one set of dummy packages installed across tests.
+
+    Attributes:
+        key (tuple): The (name, requirements) pairs of the installed dummy packages, or None if none are installed.
+        pkgs (tuple): The installed DummyPackage objects.
+        stack (ExitStack): The stack holding the entered DummyPackage context managers.
+
+    Methods:
+        ensure(*pkgs): Install the given dummy packages, replacing the installed ones if they differ.
+        clear(): Uninstall the installed dummy packages.
+        purge(names): Uninstall dummy packages left installed by an earlier, interrupted test session.
+    """
+
+    def __init__(self):
+        """
+        Initialize the _installed_pkgs object with no dummy packages installed.
+        """
+        self.key = None
+        self.pkgs = ()
+        self.stack = ExitStack()
+
+    def ensure(self, *pkgs):
+        """
+        Install the given dummy packages, replacing the installed ones if they differ.
+
+        The packages are installed concurrently. Each one runs its own pip processes with --no-dependencies, so
+        independent dummy packages do not wait for each other.
+
+        Args:
+            *pkgs (tuple): (name, requirements) pairs describing the dummy packages.
+
+        Returns:
+            tuple: The installed DummyPackage objects.
+        """
+        if pkgs == self.key:
+            return self.pkgs
+        self.clear()
+        installed = [
+            self.stack.enter_context(DummyPackage(name, requirements=list(requirements)))
+            for name, requirements in pkgs
+        ]
+        with ThreadPoolExecutor(max_workers=len(installed) or 1) as executor:
+            list(executor.map(DummyPackage.install, installed))
+        self.key = pkgs
+        self.pkgs = tuple(installed)
+        return self.pkgs
+
+    def clear(self):
+        """
+        Uninstall the installed dummy packages.
+        """
+        self.key = None
+        self.pkgs = ()
+        self.stack.close()
+
+    @staticmethod
+    def purge(names):
+        """
+        Uninstall dummy packages left installed by an earlier, interrupted test session.
+
+        Args:
+            names (iterable): The names of the dummy packages.
+        """
+        leftovers = sorted(name for name in names if find_spec(name) is not None)
+        if leftovers:
+            run([sys.executable, "-m", "pip", "uninstall", "--yes", *leftovers], stdout=DEVNULL, stderr=DEVNULL,
+                check=True)
+
+
+_PKG_SETS = {
+    "pkg1": (("package1", ()),),
+    "pkg1_req_pkg2": (("package1", ("package2",)),),
+    "pkg1_and_pkg2": (("package1", ()), ("package2", ()))
+}
+
+_DUMMY_PKG_FIXTURES = {
+    "installed_pkgs",
+    "installed_pkg1",
+    "installed_pkg1_req_pkg2",
+    "installed_pkg1_and_pkg2",
+    "uninstalled_pkgs"
+}
+
+
+_INTEGRATION_PREFIXES = ("test_main__", "test_get_list")
+# test_main__help only renders the help of the argument parser, without running the command-line client.
+_UNIT_TESTS = {"test_main__help"}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """
+    Mark the tests that depend on the installed dummy packages as slow and send them to a single pytest-xdist worker,
+    and mark the tests that run the command-line client or pipdeptree as integration tests.
+    """
+    for item in items:
+        if _DUMMY_PKG_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.slow)
+            item.add_marker(pytest.mark.xdist_group("dummy_pkgs"))
+        if item.name.startswith(_INTEGRATION_PREFIXES) and item.name not in _UNIT_TESTS:
+            item.add_marker(pytest.mark.integration)
+
+
+@pytest.fixture(scope="session")
+def _dummy_pkgs():
+    """
+    Provide the dummy package installations shared by the whole test session, starting from an environment without
+    any dummy package.
+    """
+    pkgs = _installed_pkgs()
+    pkgs.purge({name for pkg_set in _PKG_SETS.values() for pkg in pkg_set for name in (pkg[0], *pkg[1])})
+    yield pkgs
+    pkgs.clear()
+
+
+@pytest.fixture
+def installed_pkgs(request, _dummy_pkgs):
+    """
+    Make sure only the package set named by the indirect parameter is installed, and provide its DummyPackage objects.
+
+    Usage:
+        @pytest.mark.parametrize("installed_pkgs", ["pkg1_req_pkg2", "pkg1_and_pkg2"], indirect=True)
+    """
+    return _dummy_pkgs.ensure(*_PKG_SETS[request.param])
+
+
+@pytest.fixture
+def installed_pkg1(_dummy_pkgs):
+    """
+    Make sure only package1 is installed, and provide its DummyPackage.
+    """
+    return _dummy_pkgs.ensure(*_PKG_SETS["pkg1"])[0]
+
+
+@pytest.fixture
+def installed_pkg1_req_pkg2(_dummy_pkgs):
+    """
+    Make sure only package1, which requires package2, and package2 are installed, and provide the DummyPackage of
+    package1.
+    """
+    return _dummy_pkgs.ensure(*_PKG_SETS["pkg1_req_pkg2"])[0]
+
+
+@pytest.fixture
+def installed_pkg1_and_pkg2(_dummy_pkgs):
+    """
+    Make sure only the independent package1 and package2 are installed, and provide their DummyPackage objects.
+    """
+    return _dummy_pkgs.ensure(*_PKG_SETS["pkg1_and_pkg2"])
+
+
+@pytest.fixture
+def uninstalled_pkgs(_dummy_pkgs):
+    """
+    Make sure no dummy package is installed.
+    """
+    _dummy_pkgs.clear()
+
+
+@pytest.fixture(scope="session")
+def dummy_pkg_files():
+    """
+    Provide a function returning the path of a requirements file with the given number of dummy packages.
+
+    Each file is created on first use and removed when the test session finishes.
+    """
+    with ExitStack() as stack:
+        @lru_cache(maxsize=None)
+        def get(count):
+            return stack.enter_context(_dummy_pkg_file(count)).file.name
+
+        yield get
+
+
+@pytest.fixture(scope="session")
+def pkg_files():
+    """
+    Provide a function returning the path of a requirements file listing the given packages.
+
+    Each file is created on first use and removed when the test session finishes.
+    """
+    with ExitStack() as stack:
+        @lru_cache(maxsize=None)
+        def get(*pkgs):
+            return stack.enter_context(_pkg_file(list(pkgs))).file.name
+
+        yield get
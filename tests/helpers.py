@@ -6,8 +6,9 @@ provide temporary files for testing the functionalities of the check_requirement
 """
 
 import os
-import sys
 from io import StringIO
+from pathlib import Path
+from contextlib import redirect_stdout
 from tempfile import NamedTemporaryFile
 import re
 
@@ -24,34 +25,71 @@ def _capture_stdout(func, *args, **kwargs):
     Returns:
         str: Captured standard output as a string.
     """
-    old_stdout = sys.stdout
     new_stdout = StringIO()
-    sys.stdout = new_stdout
-    try:
+    with redirect_stdout(new_stdout):
         func(*args, **kwargs)
-        sys.stdout.seek(0)
-        return new_stdout.read()
-    finally:
-        sys.stdout = old_stdout
+    return new_stdout.getvalue()
 
 
-def _search_pattern(text, pattern, flag):
+class _pattern_sink:
     """
-    Search for a regular expression pattern in a given text.
+    Write-only stream that searches a regular expression pattern in the text written to it, line by line.
+
+    Only the current incomplete line is buffered, so the full output is never materialized. Patterns must not span
+    multiple lines.
+
+    Args:
+        pattern (str or re.Pattern): The regular expression pattern to search for. Precompile it to set matching flags.
+
+    Attributes:
+        pattern (re.Pattern): The compiled regular expression pattern.
+        line (str): The current incomplete line.
+        matched (bool): True once the pattern is found in a complete line.
+    """
+
+    def __init__(self, pattern):
+        """
+        Initialize the _pattern_sink object with the specified pattern.
+        """
+        self.pattern = re.compile(pattern)
+        self.line = ""
+        self.matched = False
+
+    def write(self, text):
+        """
+        Search the complete lines in the written text and keep the trailing incomplete line.
+        """
+        if not self.matched:
+            lines = (self.line + text).split("\n")
+            self.line = lines.pop()
+            self.matched = any(self.pattern.search(line) for line in lines)
+            if self.matched:
+                self.line = ""
+        return len(text)
+
+    def flush(self):
+        """
+        Nothing is buffered beyond the current line, so there is nothing to flush.
+        """
+
+
+def _stdout_matches(func, pattern, *args, **kwargs):
+    """
+    Search for a regular expression pattern in the standard output produced by a function without capturing it.
 
     Args:
-        text (str): The text to search within.
-        pattern (str): The regular expression pattern to search for.
-        flag: Flags to control regular expression matching.
+        func: The function whose standard output needs to be searched.
+        pattern (str or re.Pattern): The regular expression pattern to search for. Precompile it to set matching flags.
+        *args: Positional arguments to be passed to the function.
+        **kwargs: Keyword arguments to be passed to the function.
 
     Returns:
-        bool: True if the pattern is found in the text, False otherwise.
+        bool: True if the pattern is found in the standard output, False otherwise.
     """
-    pattern = re.compile(pattern, flag)
-    match = pattern.search(text)
-    if match:
-        return True
-    return False
+    sink = _pattern_sink(pattern)
+    with redirect_stdout(sink):
+        func(*args, **kwargs)
+    return sink.matched or bool(sink.pattern.search(sink.line))
 
 
 def _read_file(file_path):
@@ -59,13 +97,12 @@ def _read_file(file_path):
     Read the contents of a file.
 
     Args:
-        file_path (str): The path of the file to read.
+        file_path (str or os.PathLike): The path of the file to read.
 
     Returns:
         str: The contents of the file.
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        return file.read()
+    return Path(file_path).read_text(encoding="utf-8")
 
 
 class _dummy_pkg_file:
@@ -104,9 +141,9 @@ class _dummy_pkg_file:
         """
         Create the temporary file and write dummy package names.
         """
-        with self.file:
-            for i in range(1, self.count + 1):
-                self.file.write(f"package{i} == 0.1.0\n".encode("utf-8"))
+        payload = "".join(f"package{i} == 0.1.0\n" for i in range(1, self.count + 1))
+        self.file.write(payload.encode("utf-8"))
+        self.file.close()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -152,10 +189,9 @@ class _pkg_file:
         """
         Create the temporary file and write specified package names.
         """
-        with self.file:
-            for pkg in self.pkgs:
-                pkg = f"{pkg}\n"
-                self.file.write(pkg.encode("utf-8"))
+        payload = "".join(f"{pkg}\n" for pkg in self.pkgs)
+        self.file.write(payload.encode("utf-8"))
+        self.file.close()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -5,14 +5,33 @@ The tester functions are designed to simulate specific test scenarios and assist
 functionality of check_requirements.
 """
 
-import sys
 import os
+from io import StringIO
+from contextlib import redirect_stdout
 from tempfile import NamedTemporaryFile
-from unittest.mock import patch
-import pytest
 from check_requirements import get_list, parse_deps_tree, add_info, filter_deps_tree, ignore_pkgs, print_deps_tree, \
-    write_deps_tree_to_file, is_pkg_in_subtree, find_missing_pkgs, check_and_raise_error
-from .helpers import _capture_stdout
+    write_deps_tree_to_file, index_deps_tree, is_pkg_in_subtree, find_missing_pkgs, check_and_raise_error
+from check_requirements.__main__ import main as rtmain, get_parser
+from .helpers import _capture_stdout, _stdout_matches
+
+__all__ = [
+    "get_list_tester",
+    "parse_deps_tree_tester",
+    "add_info_tester",
+    "filter_deps_tree_tester",
+    "ignore_pkgs_tester",
+    "print_deps_tree_tester",
+    "write_deps_tree_to_file_tester",
+    "index_deps_tree_tester",
+    "is_pkg_in_subtree_tester",
+    "find_missing_pkgs_tester",
+    "check_and_raise_error_tester",
+    "main_tester",
+    "main_report_tester",
+    "main_output_tester",
+    "main_search_tester",
+    "format_help_tester"
+]
 
 
 def get_list_tester():
@@ -51,29 +70,42 @@ def filter_deps_tree_tester(deps, **kwargs):
 
 
 def ignore_pkgs_tester(deps, ignored_pkgs):
+    """
+    Tester function for ignore_pkgs. Simulates removing ignored packages from the dependency tree.
+    """
     return ignore_pkgs(deps, ignored_pkgs)
 
 
 def print_deps_tree_tester(deps):
     """
     Tester function for print_deps_tree. Simulates printing the dependency tree structure.
+
+    Returns the printed lines as a tuple.
     """
-    return _capture_stdout(print_deps_tree, deps).split('\n')
+    return tuple(_capture_stdout(print_deps_tree, deps).splitlines())
 
 
 def write_deps_tree_to_file_tester(deps):
     """
     Tester function for write_deps_tree_to_file. Simulates writing the dependency tree to a file.
+
+    Returns the written lines as a tuple.
     """
-    written_lines = None
     with NamedTemporaryFile(delete=False) as temp_file:
         write_deps_tree_to_file(temp_file.name, deps)
         with open(temp_file.name, 'r', encoding="utf-8") as file:
-            written_lines = file.readlines()
+            written_lines = tuple(file.readlines())
     os.remove(temp_file.name)
     return written_lines
 
 
+def index_deps_tree_tester(deps):
+    """
+    Tester function for index_deps_tree. Simulates indexing the packages of a dependency tree by name.
+    """
+    return index_deps_tree(deps)
+
+
 def is_pkg_in_subtree_tester(pkg, deps):
     """
     Tester function for is_pkg_in_subtree. Simulates checking if a package is present in a dependency subtree.
@@ -92,14 +124,58 @@ def check_and_raise_error_tester(deps_a, deps_b):
     """
     Tester function for check_and_raise_error. Simulates checking and raising errors for missing or extra dependencies.
     """
-    with pytest.raises(ImportError):
+    try:
         check_and_raise_error(deps_a, deps_b)
+    except ImportError:
+        return
+    raise AssertionError("check_and_raise_error did not raise ImportError")
 
 
 def main_tester(command):
     """
     Tester function for the main script. Simulates running the main script with specified command-line arguments.
     """
-    from check_requirements.__main__ import main as rtmain
-    with patch.object(sys, 'argv', command.split(" ")):
-        return _capture_stdout(rtmain)
+    return _capture_stdout(rtmain, command.split()[1:])
+
+
+def main_report_tester(command, raises=False):
+    """
+    Tester function for the main script. Simulates running a check of the main script and returns its report, which
+    is the printed output, or the message of the ImportError when the check is expected to raise one.
+    """
+    if not raises:
+        return main_tester(command)
+    try:
+        main_tester(command)
+    except ImportError as error:
+        return str(error)
+    raise AssertionError(f"{command} did not raise ImportError")
+
+
+def main_output_tester(command):
+    """
+    Tester function for the main script. Simulates running the main script with specified command-line arguments and
+    returns its printed output, followed by the message of the ImportError it raises, if any.
+    """
+    output = StringIO()
+    try:
+        with redirect_stdout(output):
+            rtmain(command.split()[1:])
+    except ImportError as error:
+        return output.getvalue() + str(error)
+    return output.getvalue()
+
+
+def main_search_tester(command, pattern):
+    """
+    Tester function for the main script. Simulates running the main script with specified command-line arguments and
+    searches its output for a regular expression pattern without capturing it.
+    """
+    return _stdout_matches(rtmain, pattern, command.split()[1:])
+
+
+def format_help_tester():
+    """
+    Tester function for the help of the main script. Simulates rendering the help message of the argument parser.
+    """
+    return get_parser().format_help()
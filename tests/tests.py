@@ -9,22 +9,125 @@ import os
 import sys
 import platform
 import re
-from contextlib import suppress
-from unittest import TestCase
-from dummy_package_manager import DummyPackage
-from .helpers import _search_pattern, _read_file, _dummy_pkg_file, _pkg_file
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from .helpers import _read_file
 from .testers import get_list_tester, parse_deps_tree_tester, add_info_tester, filter_deps_tree_tester, \
-    ignore_pkgs_tester, print_deps_tree_tester, write_deps_tree_to_file_tester, is_pkg_in_subtree_tester, \
-    find_missing_pkgs_tester, check_and_raise_error_tester, main_tester
+    ignore_pkgs_tester, print_deps_tree_tester, write_deps_tree_to_file_tester, index_deps_tree_tester, \
+    is_pkg_in_subtree_tester, find_missing_pkgs_tester, check_and_raise_error_tester, main_tester, \
+    main_report_tester, main_output_tester, main_search_tester, format_help_tester
 
 PYTHON_VERSION = ".".join(platform.python_version_tuple()[:2])
 
+_PAT_PKG_EQ = re.compile(r"([^\s]+)==[^\n]+", re.DOTALL)
+_PAT_PKG_EQ_SPACED = re.compile(r"([^\s]+) == [^\n]+", re.DOTALL)
+_PAT_PKG_INFO = re.compile(r"([\w-]+) == [\d.]+; sys_platform == \w+ and python_version == \d\.\d{1,2}")
+
+_HELP_EXPECTED = (Path(__file__).parent / "fixtures" / "help.txt").read_text(encoding="utf-8")
+
+_SIMPLE_DEPS = (
+    {
+        "name": "package1",
+        "version": "1.0",
+        "deps": [
+            {
+                "name": "package2",
+                "version": "2.0",
+                "deps": []
+            }
+        ]
+    },
+)
+
+_FLAT_DEPS = (
+    {
+        "name": "package1",
+        "version": "1.0",
+        "deps": []
+    },
+)
+
+_DEPS_WITH_IGNORED = (
+    {
+        "name": "package1",
+        "version": "1.0",
+        "deps": [
+            {
+                "name": "package2",
+                "version": "2.0",
+                "deps": []
+            }
+        ]
+    },
+    {
+        "name": "ignored_package_1",
+        "version": "1.0",
+        "deps": []
+    },
+    {
+        "name": "ignored_package_2",
+        "version": "2.0.0",
+        "deps": []
+    }
+)
+
+_FILTER_DEPS = (
+    {
+        "name": "package1",
+        "version": "1.0",
+        "deps": [],
+        "python_version": "3.7",
+        "sys_platform": "linux"
+    },
+    {
+        "name": "package2",
+        "version": "2.0",
+        "deps": [],
+        "python_version": "3.8",
+        "sys_platform": "win32"
+    },
+    {
+        "name": "package3",
+        "version": "3.0",
+        "deps": [],
+        "python_version": "3.9",
+        "sys_platform": "linux"
+    }
+)
+
+_IGNORED_PKGS = (
+    {"name": "ignored_package_1", "version": "", "deps": []},
+    {"name": "ignored_package_2", "version": "2.0.0", "deps": []}
+)
+
+_EXPECTED_PRINTED = (
+    "package1 == 1.0",
+    "  package2 == 2.0"
+)
+
+_INFO_SUFFIX = f"; python_version == {PYTHON_VERSION} and sys_platform == {sys.platform}"
+
+_EXPECTED_PRINTED_WITH_INFO = tuple(line + _INFO_SUFFIX for line in _EXPECTED_PRINTED)
+
+_EXPECTED_WRITTEN = tuple(line + "\n" for line in _EXPECTED_PRINTED)
+
+_EXPECTED_WRITTEN_WITH_INFO = tuple(line + "\n" for line in _EXPECTED_PRINTED_WITH_INFO)
+
+
+def _clone(deps):
+    """
+    Return a mutable copy of a shared dependency tree for tests whose code under test modifies the tree in place.
+    """
+    return [deepcopy(pkg) for pkg in deps]
+
 
 def test_get_list():
     """
     Test if the get_list function correctly lists dependencies.
     """
-    assert _search_pattern(get_list_tester(), r"([^\s]+)==[^\n]+", re.DOTALL)
+    assert _PAT_PKG_EQ.search(get_list_tester())
 
 
 def test_parse_deps_tree():
@@ -43,19 +146,7 @@ def test_add_info():
     """
     Test if the add_info function correctly adds Python version and system platform information to dependencies.
     """
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
+    deps = _clone(_SIMPLE_DEPS)
     deps_with_info = add_info_tester(deps, python_version=PYTHON_VERSION, sys_platform=sys.platform)
     assert isinstance(deps_with_info, list)
     assert deps_with_info[0]["python_version"] == PYTHON_VERSION
@@ -64,178 +155,50 @@ def test_add_info():
     assert deps_with_info[0]["deps"][0]["sys_platform"] == sys.platform
 
 
-def test_filter_deps_tree():
+@pytest.mark.parametrize(
+    "criteria, expected_names",
+    [
+        ({"name": "package2"}, ["package2"]),
+        ({"version": "1.0"}, ["package1"]),
+        ({"python_version": "3.8"}, ["package2"]),
+        ({"sys_platform": "linux"}, ["package1", "package3"]),
+        ({"name": "package3", "version": "3.0", "python_version": "3.9", "sys_platform": "linux"}, ["package3"]),
+        ({"name": "nonexistent_package"}, [])
+    ],
+    ids=["name", "version", "python_version", "sys_platform", "all", "no_match"]
+)
+def test_filter_deps_tree(criteria, expected_names):
     """
     Test the filter_deps_tree function.
 
-    This test function checks the behavior of the filter_deps_tree function by providing a sample dependency tree
-    with additional information such as Python version and system platform. It then filters the tree using various
-    criteria and asserts the correctness of the filtered results.
+    This test function checks the behavior of the filter_deps_tree function by filtering a sample dependency tree with
+    additional information such as Python version and system platform, and asserts that exactly the packages matching
+    every criterion are kept.
 
-    Test cases cover filtering by 'name', 'version', 'python_version', and 'sys_platform'.
+    Test cases cover filtering by 'name', 'version', 'python_version', and 'sys_platform', by all of them at once, and
+    by a name that matches no package.
     """
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [],
-            "python_version": "3.7",
-            "sys_platform": "linux"
-        },
-        {
-            "name": "package2",
-            "version": "2.0",
-            "deps": [],
-            "python_version": "3.8",
-            "sys_platform": "win32"
-        },
-        {
-            "name": "package3",
-            "version": "3.0",
-            "deps": [],
-            "python_version": "3.9",
-            "sys_platform": "linux"
-        }
-    ]
-
-    # Test filtering by name
-    filtered_deps = filter_deps_tree_tester(deps, name="package2")
-    assert len(filtered_deps) == 1
-    assert filtered_deps[0]["name"] == "package2"
-
-    # Test filtering by version
-    filtered_deps = filter_deps_tree_tester(deps, version="1.0")
-    assert len(filtered_deps) == 1
-    assert filtered_deps[0]["version"] == "1.0"
-
-    # Test filtering by python_version
-    filtered_deps = filter_deps_tree_tester(deps, python_version="3.8")
-    assert len(filtered_deps) == 1
-    assert filtered_deps[0]["python_version"] == "3.8"
-
-    # Test filtering by sys_platform
-    filtered_deps = filter_deps_tree_tester(deps, sys_platform="linux")
-    assert len(filtered_deps) == 2
-    assert all(pkg["sys_platform"] == "linux" for pkg in filtered_deps)
-
-    # Test filtering by name, version, python_version, and sys_platform
-    filtered_deps = filter_deps_tree_tester(
-        deps,
-        name="package3",
-        version="3.0",
-        python_version="3.9",
-        sys_platform="linux"
-    )
-    assert len(filtered_deps) == 1
-    assert filtered_deps[0]["name"] == "package3"
-    assert filtered_deps[0]["version"] == "3.0"
-    assert filtered_deps[0]["python_version"] == "3.9"
-    assert filtered_deps[0]["sys_platform"] == "linux"
+    filtered_deps = filter_deps_tree_tester(_FILTER_DEPS, **criteria)
+    assert [pkg["name"] for pkg in filtered_deps] == expected_names
+    assert all(pkg[key] == val for pkg in filtered_deps for key, val in criteria.items())
 
-    # Test filtering with no matches
-    filtered_deps = filter_deps_tree_tester(deps, name="nonexistent_package")
-    assert len(filtered_deps) == 0
 
-
-def test_print_deps_tree():
+@pytest.mark.parametrize(
+    "emit, expected, expected_with_info",
+    [
+        (print_deps_tree_tester, _EXPECTED_PRINTED, _EXPECTED_PRINTED_WITH_INFO),
+        (write_deps_tree_to_file_tester, _EXPECTED_WRITTEN, _EXPECTED_WRITTEN_WITH_INFO)
+    ],
+    ids=["print", "write"]
+)
+def test_emit_deps_tree(emit, expected, expected_with_info):
     """
-    Test if the print_deps_tree function correctly prints the dependency tree structure.
+    Test if the print_deps_tree and write_deps_tree_to_file functions correctly emit the dependency tree structure,
+    with and without added information.
     """
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-    printed_lines = print_deps_tree_tester(deps)
-    assert printed_lines[0] == "package1 == 1.0"
-    assert printed_lines[1] == "  package2 == 2.0"
-    assert len(printed_lines) == 3
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-    deps = add_info_tester(deps, python_version=PYTHON_VERSION, sys_platform=sys.platform)
-    assert deps[0]["python_version"] == PYTHON_VERSION
-    assert deps[0]["sys_platform"] == sys.platform
-    assert deps[0]["deps"][0]["python_version"] == PYTHON_VERSION
-    assert deps[0]["deps"][0]["sys_platform"] == sys.platform
-    printed_lines = print_deps_tree_tester(deps)
-    assert printed_lines[0] == f"package1 == 1.0; "\
-                               f"python_version == {PYTHON_VERSION} and "\
-                               f"sys_platform == {sys.platform}"
-    assert printed_lines[1] == f"  package2 == 2.0; "\
-                               f"python_version == {PYTHON_VERSION} and "\
-                               f"sys_platform == {sys.platform}"
-    assert len(printed_lines) == 3
-
-
-def test_write_deps_tree_to_file():
-    """
-    Test if the write_deps_tree_to_file function correctly writes the dependency tree to a file.
-    """
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-
-    written_lines = write_deps_tree_to_file_tester(deps)
-    expected_lines = [
-        "package1 == 1.0\n",
-        "  package2 == 2.0\n"
-    ]
-    assert written_lines == expected_lines
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-    deps = add_info_tester(deps, python_version=PYTHON_VERSION, sys_platform=sys.platform)
-    assert deps[0]["python_version"] == PYTHON_VERSION
-    assert deps[0]["sys_platform"] == sys.platform
-    assert deps[0]["deps"][0]["python_version"] == PYTHON_VERSION
-    assert deps[0]["deps"][0]["sys_platform"] == sys.platform
-    written_lines = write_deps_tree_to_file_tester(deps)
-    expected_lines = [
-        f"package1 == 1.0; python_version == {PYTHON_VERSION}"
-        f" and sys_platform == {sys.platform}\n",
-        f"  package2 == 2.0; python_version == {PYTHON_VERSION}"
-        f" and sys_platform == {sys.platform}\n"
-    ]
-    assert written_lines == expected_lines
+    assert emit(_SIMPLE_DEPS) == expected
+    deps = add_info_tester(_clone(_SIMPLE_DEPS), python_version=PYTHON_VERSION, sys_platform=sys.platform)
+    assert emit(deps) == expected_with_info
 
 
 def test_is_pkg_in_subtree():
@@ -246,62 +209,59 @@ def test_is_pkg_in_subtree():
         "name": "package2",
         "version": "2.0"
     }
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-    assert is_pkg_in_subtree_tester(pkg, deps)
-    pkg = {
-        "name": "package2",
-        "version": "2.0"
-    }
-    deps = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": []
-        }
-    ]
-    assert not is_pkg_in_subtree_tester(pkg, deps)
+    assert is_pkg_in_subtree_tester(pkg, _SIMPLE_DEPS)
+    assert not is_pkg_in_subtree_tester(pkg, _FLAT_DEPS)
+
+
+def test_is_pkg_in_subtree__indexed():
+    """
+    Test if the is_pkg_in_subtree function gives the same results for a dependency tree and for its index.
+    """
+    index = index_deps_tree_tester(_SIMPLE_DEPS)
+    assert index == {"package1": {"1.0"}, "package2": {"2.0"}}
+    for pkg in (
+            {"name": "package2", "version": "2.0"},
+            {"name": "package2", "version": "3.0"},
+            {"name": "package2"},
+            {"name": "package3", "version": "2.0"}
+    ):
+        assert is_pkg_in_subtree_tester(pkg, index) == is_pkg_in_subtree_tester(pkg, _SIMPLE_DEPS)
 
 
 def test_find_missing_pkgs():
     """
     Test if the find_missing_pkgs function correctly identifies missing packages between two dependency trees.
     """
-    deps_a = [
+    deps_a = _SIMPLE_DEPS
+    deps_b = _FLAT_DEPS
+    missing_pkgs = find_missing_pkgs_tester(deps_a, deps_b)
+    assert isinstance(missing_pkgs, list)
+    assert len(missing_pkgs) == 1
+    assert missing_pkgs == [{"name": "package2", "version": "2.0", "deps": []}]
+    assert missing_pkgs[0]["name"] == "package2"
+    assert missing_pkgs[0]["version"] == "2.0"
+
+
+def test_find_missing_pkgs__version_mismatch():
+    """
+    Test if the find_missing_pkgs function correctly identifies packages whose name is present in the other dependency
+    tree with a different version, and treats packages without a version as matching any version.
+    """
+    deps_a = _SIMPLE_DEPS
+    deps_b = [
         {
             "name": "package1",
-            "version": "1.0",
             "deps": [
                 {
                     "name": "package2",
-                    "version": "2.0",
+                    "version": "3.0",
                     "deps": []
                 }
             ]
         }
     ]
-    deps_b = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": []
-        }
-    ]
     missing_pkgs = find_missing_pkgs_tester(deps_a, deps_b)
-    assert isinstance(missing_pkgs, list)
     assert len(missing_pkgs) == 1
-    assert missing_pkgs == [{"name": "package2", "version": "2.0", "deps": []}]
     assert missing_pkgs[0]["name"] == "package2"
     assert missing_pkgs[0]["version"] == "2.0"
 
@@ -311,40 +271,9 @@ def test_find_missing_pkgs__ignored():
     Test if the find_missing_pkgs function correctly identifies missing packages
     considering the ignored packages.
     """
-    deps_a = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        },
-        {
-            "name": "ignored_package_1",
-            "version": "1.0",
-            "deps": []
-        },
-        {
-            "name": "ignored_package_2",
-            "version": "2.0.0",
-            "deps": []
-        }
-    ]
-    deps_b = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": []
-        }
-    ]
-    ignored_pkgs = [
-        {"name": "ignored_package_1", "version": "", "deps": []},
-        {"name": "ignored_package_2", "version": "2.0.0", "deps": []}
-    ]
+    deps_a = _DEPS_WITH_IGNORED
+    deps_b = _FLAT_DEPS
+    ignored_pkgs = _IGNORED_PKGS
     deps_a = ignore_pkgs_tester(deps_a, ignored_pkgs)
     missing_pkgs = find_missing_pkgs_tester(deps_a, deps_b)
     assert isinstance(missing_pkgs, list)
@@ -357,26 +286,8 @@ def test_check_and_raise_error():
     """
     Test if the check_and_raise_error function correctly checks and raises errors for missing or extra dependencies.
     """
-    deps_a = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        }
-    ]
-    deps_b = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": []
-        }
-    ]
+    deps_a = _SIMPLE_DEPS
+    deps_b = _FLAT_DEPS
     check_and_raise_error_tester(deps_a, deps_b)
 
 
@@ -384,264 +295,127 @@ def test_check_and_raise_error__ignored():
     """
     Test if the check_and_raise_error function correctly checks and raises errors with ignored packages.
     """
-    deps_a = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": [
-                {
-                    "name": "package2",
-                    "version": "2.0",
-                    "deps": []
-                }
-            ]
-        },
-        {
-            "name": "ignored_package_1",
-            "version": "1.0",
-            "deps": []
-        },
-        {
-            "name": "ignored_package_2",
-            "version": "2.0.0",
-            "deps": []
-        }
-    ]
-    deps_b = [
-        {
-            "name": "package1",
-            "version": "1.0",
-            "deps": []
-        }
-    ]
-    ignored_pkgs = [
-        {"name": "ignored_package_1", "version": "", "deps": []},
-        {"name": "ignored_package_2", "version": "2.0.0", "deps": []}
-    ]
+    deps_a = _DEPS_WITH_IGNORED
+    deps_b = _FLAT_DEPS
+    ignored_pkgs = _IGNORED_PKGS
     deps_a = ignore_pkgs_tester(deps_a, ignored_pkgs)
     check_and_raise_error_tester(deps_a, deps_b)
 
 
+@pytest.mark.skipif(
+    not (3, 10) <= sys.version_info[:2] < (3, 13),
+    reason="argparse renders option headings and aliases differently on other Python versions"
+)
 def test_main__help():
     """
     Test the command-line help output for the main script.
     """
-    expected_output = "usage: check_requirements [-h] [--list] [--list-file LIST_FILE]\n                          " \
-                      "[--check-missing CHECK_MISSING]\n                          [--check-extra CHECK_EXTRA] [" \
-                      "--raise-missing-error]\n                          [--raise-extra-error] [--ignore IGNORE]\n   " \
-                      "                       [--ignore-packages IGNORE_PACKAGES [IGNORE_PACKAGES ...]]\n            " \
-                      "              [--with-info]\n\ncheck_requirements\n\noptional arguments:\n  -h, --help        " \
-                      "    show this help message and exit\n  --list, -l            List dependencies to console\n  " \
-                      "--list-file LIST_FILE, -lf LIST_FILE\n                        Save dependencies to a file\n  " \
-                      "--check-missing CHECK_MISSING, -cm CHECK_MISSING\n                        Check for missing " \
-                      "dependencies and print\n  --check-extra CHECK_EXTRA, -ce CHECK_EXTRA\n                        " \
-                      "Check for extra dependencies and print\n  --raise-missing-error, -rme\n                       " \
-                      "Check for missing dependencies and raise error\n  --raise-extra-error, -ree\n                 " \
-                      "        Check for extra dependencies and raise error\n  --ignore IGNORE, -i IGNORE\n          " \
-                      "              File containing ignored packages\n  --ignore-packages IGNORE_PACKAGES [" \
-                      "IGNORE_PACKAGES ...], -ip IGNORE_PACKAGES [IGNORE_PACKAGES ...]\n                        List " \
-                      "of packages to ignore\n  --with-info, -wi      Include requested system information\n"
-    with suppress(SystemExit):
-        assert expected_output == main_tester("check_requirements -h")
+    with patch.dict(os.environ, {"COLUMNS": "80"}):
+        assert _HELP_EXPECTED == format_help_tester()
 
 
 def test_main__list():
     """
     Test listing dependencies to the console using the main script.
     """
-    assert _search_pattern(main_tester("check_requirements -l"), r"([^\s]+) == [^\n]+", re.DOTALL)
+    assert main_search_tester("check_requirements -l", _PAT_PKG_EQ_SPACED)
 
 
 def test_main__list_with_info():
     """
     Test listing dependencies with additional information to the console using the main script.
     """
-    assert _search_pattern(
-        main_tester("check_requirements -l -wi sys_platform python_version"),
-        r"([\w-]+) == [\d.]+; sys_platform == \w+ and python_version == \d\.\d{1,2}",
-        0
+    assert main_search_tester(
+        "check_requirements -l -wi sys_platform python_version",
+        _PAT_PKG_INFO
     )
 
 
-def test_main__output():
+def test_main__output(tmp_path):
     """
     Test saving dependencies to a file using the main script.
     """
-    main_tester("check_requirements -o output.txt")
-    assert _search_pattern(_read_file("output.txt"), r"([^\s]+) == [^\n]+", re.DOTALL)
-    os.remove("output.txt")
+    output_file = tmp_path / "output.txt"
+    main_tester(f"check_requirements -o {output_file}")
+    assert _PAT_PKG_EQ_SPACED.search(_read_file(output_file))
 
 
-def test_main__output_with_info():
+def test_main__output_with_info(tmp_path):
     """
     Test saving dependencies with additional information to a file using the main script.
     """
-    main_tester("check_requirements -o output.txt -wi sys_platform python_version")
-    assert _search_pattern(
-        _read_file("output.txt"),
-        r"([\w-]+) == [\d.]+; sys_platform == \w+ and python_version == \d\.\d{1,2}",
-        0
-    )
-    os.remove("output.txt")
-
-
-def test_main__check_missing():
-    """
-    Test checking for missing dependencies using the main script.
-    """
-    with DummyPackage("package1") as dummy_pkg:
-        dummy_pkg.install()
-        assert "package1" in main_tester("check_requirements -cm -f requirements.txt")
+    output_file = tmp_path / "output.txt"
+    main_tester(f"check_requirements -o {output_file} -wi sys_platform python_version")
+    assert _PAT_PKG_INFO.search(_read_file(output_file))
 
 
-def test_main__check_missing_ignore():
+@pytest.mark.parametrize("action, raises", [("-cm", False), ("-rme", True)])
+def test_main__check_missing(installed_pkg1, action, raises):
     """
-    Test checking for missing dependencies using the main script while ignoring specified packages.
+    Test checking for missing dependencies using the main script, printing them or raising ImportError for them.
     """
-    with DummyPackage("package1", requirements=["package2"]) as dummy_pkg:
-        dummy_pkg.install()
-        with _pkg_file(["package1"]) as ignored:
-            output = main_tester(f"check_requirements -cm -f requirements.txt -i {ignored.file.name}")
-            assert "package1" not in output
-            assert "package2" in output
+    assert "package1" in main_report_tester(f"check_requirements {action} -f requirements.txt", raises)
 
 
-def test_main__check_missing_ignore_packages():
+def test_main__check_missing_ignore(installed_pkg1_req_pkg2, pkg_files):
     """
-    Test checking for missing dependencies using the main script while ignoring specified packages.
+    Test checking for missing dependencies using the main script while ignoring the packages listed in a file.
     """
-    with DummyPackage("package1", requirements=["package2"]) as dummy_pkg:
-        dummy_pkg.install()
-        output = main_tester("check_requirements -cm -f requirements.txt -ip package1")
-        assert "package1" not in output
-        assert "package2" in output
+    output = main_tester(f"check_requirements -cm -f requirements.txt -i {pkg_files('package1')}")
+    assert "package1" not in output
+    assert "package2" in output
 
 
-def test_main__check_missing_ignore__2():
+@pytest.mark.parametrize("action, raises", [("-cm", False), ("-rme", True)])
+@pytest.mark.parametrize("installed_pkgs", ["pkg1_req_pkg2", "pkg1_and_pkg2"], indirect=True)
+def test_main__check_missing_ignore_packages(installed_pkgs, action, raises):
     """
-    Test checking for missing dependencies using the main script while ignoring specified packages.
+    Test checking for missing dependencies using the main script while ignoring specified packages, whether or not
+    the ignored package requires the other one.
     """
-    with DummyPackage("package1") as dummy_pkg_1:
-        with DummyPackage("package2") as dummy_pkg_2:
-            dummy_pkg_1.install()
-            dummy_pkg_2.install()
-            with _pkg_file(["package1"]) as ignored:
-                output = main_tester(f"check_requirements -cm -f requirements.txt -i {ignored.file.name}")
-                assert "package1" not in output
-                assert "package2" in output
+    output = main_report_tester(f"check_requirements {action} -f requirements.txt -ip package1", raises)
+    assert "package1" not in output
+    assert "package2" in output
 
 
-def test_main__check_missing_ignore_packages__2():
+@pytest.mark.parametrize("action, raises", [("-cm", False), ("-rme", True)])
+def test_main__check_missing_ignore_packages_with_raise_extra(installed_pkg1_req_pkg2, action, raises):
     """
-    Test checking for missing dependencies using the main script while ignoring specified packages.
+    Test checking for missing dependencies while also raising for extra dependencies using the main script, ignoring
+    specified packages in both checks. Whether -ree raises depends on the environment, so it is only required to raise
+    when the missing dependencies are raised for.
     """
-    with DummyPackage("package1") as dummy_pkg_1:
-        with DummyPackage("package2") as dummy_pkg_2:
-            dummy_pkg_1.install()
-            dummy_pkg_2.install()
-            output = main_tester("check_requirements -cm -f requirements.txt -ip package1")
-            assert "package1" not in output
-            assert "package2" in output
+    command = f"check_requirements {action} -ree -f requirements.txt -ip package1"
+    output = main_report_tester(command, raises) if raises else main_output_tester(command)
+    assert "package1" not in output
+    assert "package2" in output
 
 
-def test_main__check_extra():
+@pytest.mark.parametrize("action, raises", [("-ce", False), ("-ree", True)])
+def test_main__check_extra(uninstalled_pkgs, dummy_pkg_files, action, raises):
     """
-    Test checking for extra dependencies using the main script.
+    Test checking for extra dependencies using the main script, printing them or raising ImportError for them.
     """
-    with _dummy_pkg_file(1) as dummy:
-        output = main_tester(f"check_requirements -ce -f {dummy.file.name}")
-        assert "package1" in output
+    assert "package1" in main_report_tester(f"check_requirements {action} -f {dummy_pkg_files(1)}", raises)
 
 
-def test_main__check_extra_ignore():
+@pytest.mark.parametrize("action, raises", [("-ce", False), ("-ree", True)])
+def test_main__check_extra_ignore(uninstalled_pkgs, dummy_pkg_files, action, raises):
     """
     Test checking for extra dependencies using the main script while ignoring specified packages.
     """
-    with _dummy_pkg_file(1) as dummy_to_ignore:
-        with _dummy_pkg_file(2) as dummy_to_extra:
-            output = main_tester(f"check_requirements -ce -f {dummy_to_extra.file.name} -i {dummy_to_ignore.file.name}")
-            assert "package1" not in output
-            assert "package2" in output
-
-
-def test_main__check_extra_ignore_packages():
-    """
-    Test if the main function correctly raises ImportError for missing dependencies while ignoring specified packages.
-    """
-    with _dummy_pkg_file(2) as dummy_to_extra:
-        output = main_tester(f"check_requirements -ce -f {dummy_to_extra.file.name} -ip package1")
-        assert "package1" not in output
-        assert "package2" in output
-
-
-def test_main__raise_missing_error():
-    """
-    Test if the main function correctly raises ImportError for missing dependencies without ignoring any packages.
-    """
-    with DummyPackage("package1") as dummy_pkg:
-        dummy_pkg.install()
-        with TestCase().assertRaises(ImportError):
-            assert "package1" in main_tester("check_requirements -f requirements.txt -rme")
-
-
-def test_main__raise_missing_error_ignore():
-    """
-    Test if the main function correctly raises ImportError for missing dependencies while ignoring specified packages.
-    """
-    with DummyPackage("package1", requirements=["package2"]) as dummy_pkg:
-        dummy_pkg.install()
-        with _pkg_file(["package1 == 0.1.0"]) as ignored:
-            with TestCase().assertRaises(ImportError):
-                output = main_tester(f"check_requirements -f requirements.txt -i {ignored.file.name} -rme")
-                assert "package1 == 0.1.0" not in output
-                assert "package2 == 0.1.0" in output
-
-
-def test_main__raise_missing_error_ignore_packages():
-    """
-    Test if the main function correctly raises ImportError for missing dependencies while ignoring specified packages.
-    """
-    with DummyPackage("package1", requirements=["package2"]) as dummy_pkg:
-        dummy_pkg.install()
-        with TestCase().assertRaises(ImportError):
-            output = main_tester("check_requirements -f requirements.txt -ip package1==0.1.0 -rme")
-            assert "package1 == 0.1.0" not in output
-            assert "package2 == 0.1.0" in output
-
-
-def test_main__raise_extra_error():
-    """
-    Test if the main function correctly raises ImportError for extra dependencies.
-    """
-    case = TestCase()
-    with _dummy_pkg_file(1) as dummy:
-        with case.assertRaises(ImportError):
-            assert "package1" in main_tester(f"check_requirements -f {dummy.file.name} -ree")
-
-
-def test_main__raise_extra_error_ignore():
-    """
-    Test if the main function correctly raises ImportError for extra dependencies while ignoring specified packages.
-    """
-    case = TestCase()
-    with _dummy_pkg_file(1) as dummy_to_ignore:
-        with _dummy_pkg_file(2) as dummy_to_extra:
-            with case.assertRaises(ImportError):
-                output = main_tester(
-                    f"check_requirements -f {dummy_to_extra.file.name} -i {dummy_to_ignore.file.name} -ree"
-                )
-                assert "package1" not in output
-                assert "package2" in output
+    output = main_report_tester(
+        f"check_requirements {action} -f {dummy_pkg_files(2)} -i {dummy_pkg_files(1)}", raises
+    )
+    assert "package1" not in output
+    assert "package2" in output
 
 
-def test_main__raise_extra_error_ignore_packages():
+@pytest.mark.parametrize("action, raises", [("-ce", False), ("-ree", True)])
+def test_main__check_extra_ignore_packages(uninstalled_pkgs, dummy_pkg_files, action, raises):
     """
-    Test if the main function correctly raises ImportError for extra dependencies while ignoring specified
-    packages.
+    Test checking for extra dependencies using the main script while ignoring specified packages.
     """
-    case = TestCase()
-    with _dummy_pkg_file(2) as dummy_to_extra:
-        with case.assertRaises(ImportError):
-            output = main_tester(f"check_requirements -f {dummy_to_extra.file.name} -ip package1 -ree")
-            assert "package1" not in output
-            assert "package2" in output
+    output = main_report_tester(f"check_requirements {action} -f {dummy_pkg_files(2)} -ip package1", raises)
+    assert "package1" not in output
+    assert "package2" in output